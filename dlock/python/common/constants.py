@@ -238,6 +238,14 @@ class GRPC(object):
     MAX_SEND_MESSAGE_LENGTH = 256 * 1024 * 1024
     MAX_RECEIVE_MESSAGE_LENGTH = 256 * 1024 * 1024
 
+    # The number of threads to serve requests in the master.
+    MASTER_SERVER_MAX_WORKERS_DEFAULT = 64
+    # The max number of concurrent requests on one connection.
+    MAX_CONCURRENT_STREAMS = 256
+    # The max number of requests waiting for a free thread in the master.
+    # The server rejects the new requests beyond it.
+    MASTER_SERVER_MAX_PENDING_RPCS = 256
+
 
 class TrainingLoopStatus(object):
     START = 1
@@ -281,6 +289,7 @@ class NodeEnv(object):
 
     # grpc env
     MASTER_CLIENT_TIMEOUT = "MASTER_CLIENT_TIMEOUT"
+    MASTER_SERVER_MAX_WORKERS = "DLOCK_MASTER_SERVER_MAX_WORKERS"
 
 
 class DatasetType(object):
@@ -373,9 +382,26 @@ class JobConstant(object):
     # sleep 1s on NetworkFailureReason.WAITING_NODE
     MASTER_CLIENT_CHECK_STRAGGLER_SLEEP_TIMEOUT = 1
 
+    # the max sleep between two queries of the network check result
+    MASTER_CLIENT_CHECK_NODE_MAX_SLEEP = 5
+
     # sleep 5s before next node check round
     NODE_CHECK_NEXT_ROUND_TIMEOUT = 5
 
+    # the master client fails fast for 10s after 5 consecutive failures
+    MASTER_CLIENT_BREAKER_FAIL_THRESHOLD = 5
+    MASTER_CLIENT_BREAKER_RESET_TIMEOUT = 10
+
+    # retry to build the master client 3s after the last failure
+    MASTER_CLIENT_REBUILD_INTERVAL = 3
+
+    # the master client waits 50ms after a report to send the following
+    # reports in the same batch and checks whether it is closed every 5s
+    # without reports.
+    MASTER_CLIENT_REPORT_FLUSH_INTERVAL = 0.05
+    MASTER_CLIENT_REPORT_IDLE_TIMEOUT = 5
+    MASTER_CLIENT_REPORT_QUEUE_SIZE = 1024
+
     TRAINING_AGENT_LOOP_DEFAULT_INTERVAL = 15
 
 
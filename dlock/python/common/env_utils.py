@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
 
 import psutil
@@ -53,14 +54,18 @@ def get_torch_restart_count():
     return int(os.getenv("TORCHELASTIC_RESTART_COUNT", 0))
 
 
+@functools.lru_cache(maxsize=1)
 def get_node_id():
-    """Get the node ID."""
+    """Get the node ID. The env is set when the node is created and
+    the value is cached."""
     node_id = int(os.getenv(NodeEnv.NODE_ID, 0))
     return node_id
 
 
+@functools.lru_cache(maxsize=1)
 def get_node_type():
-    """Get the node type."""
+    """Get the node type. The env is set when the node is created and
+    the value is cached."""
     node_type = os.getenv(NodeEnv.NODE_TYPE, "worker")
     return node_type
 
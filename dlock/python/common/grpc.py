@@ -16,7 +16,7 @@ import random
 import socket
 from contextlib import closing
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Union
 
 import grpc
 
@@ -51,6 +51,31 @@ def build_channel(addr):
     return channel
 
 
+_CONNECTIVITY_STATES = {
+    state.value[0]: state for state in grpc.ChannelConnectivity
+}
+
+
+def get_channel_state(channel):
+    """Get the connectivity state of the channel without triggering
+    a new connection. Returns None if the state is not available."""
+    try:
+        state = channel._channel.check_connectivity_state(False)
+    except Exception:
+        return None
+    return _CONNECTIVITY_STATES.get(state)
+
+
+def channel_reusable(channel) -> bool:
+    """Whether the channel is still alive and can be reused."""
+    if not channel:
+        return False
+    return get_channel_state(channel) in (
+        grpc.ChannelConnectivity.READY,
+        grpc.ChannelConnectivity.IDLE,
+    )
+
+
 def addr_connected(addr):
     addr = addr.strip()
     if not addr:
@@ -144,17 +169,20 @@ def grpc_server_ready(channel) -> bool:
         return False
 
 
-def deserialize_message(data: bytes):
+def deserialize_message(data: Union[bytes, memoryview]):
     """The method will create a message instance with the content.
     Args:
-        pickle_data: pickle bytes of a class instance.
+        data: pickle bytes of a class instance. pickle reads any
+            bytes-like object in place, so a memoryview is not copied.
     """
     message = None
     if data:
         try:
             message = pickle.loads(data)
         except Exception as e:
-            logger.warning(f"Pickle failed to load {str(data)}", e)
+            logger.warning(
+                f"Pickle failed to load {len(data)} bytes of data: {e}"
+            )
     return message
 
 
@@ -523,6 +551,13 @@ class DiagnosisAction(Message):
     action_content: str = ""
 
 
+@dataclass
+class BatchReport(Message):
+    """A batch of messages reported to the master by one RPC."""
+
+    messages: List[Message] = field(default_factory=list)
+
+
 @dataclass
 class HeartbeatResponse(Message):
     action: DiagnosisAction = field(default_factory=DiagnosisAction)
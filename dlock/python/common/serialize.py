@@ -12,9 +12,69 @@
 # limitations under the License.
 
 import json
+import math
 from dataclasses import dataclass, field
 from typing import Dict
 
+try:
+    import orjson
+
+    # orjson natively encodes datetimes and dataclasses which json
+    # rejects, so they are passed to the default to fall back to json.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def _orjson_default(obj):
+    raise TypeError(f"Object of type {type(obj).__name__} is not supported")
+
+
+def _has_non_finite_float(obj) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(
+            _has_non_finite_float(k) or _has_non_finite_float(v)
+            for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in obj)
+    return False
+
+
+def json_dumps(obj) -> str:
+    """Encode the object to a JSON string with orjson if it is installed.
+
+    orjson writes NaN and Infinity as null, so the objects with them are
+    encoded by json to keep the same output.
+    """
+    if orjson is not None and not _has_non_finite_float(obj):
+        try:
+            return orjson.dumps(
+                obj, default=_orjson_default, option=_ORJSON_OPTIONS
+            ).decode()
+        except TypeError:
+            # orjson rejects some types which json accepts like big ints,
+            # json raises the same error if it rejects the object too.
+            pass
+    return json.dumps(obj)
+
+
+def json_loads(data):
+    """Decode the JSON string or bytes with orjson if it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN and Infinity which json accepts.
+            pass
+    return json.loads(data)
+
 
 def to_dict(o):
     if hasattr(o, "to_dict"):
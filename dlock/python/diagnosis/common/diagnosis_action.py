@@ -11,7 +11,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 import threading
 from abc import ABCMeta
 from collections import deque
@@ -19,6 +18,7 @@ from datetime import datetime
 from typing import Deque, Dict, Optional
 
 from dlock.python.common.log import default_logger as logger
+from dlock.python.common.serialize import json_dumps, json_loads
 from dlock.python.diagnosis.common.constants import (
     DiagnosisActionType,
     DiagnosisConstant,
@@ -94,7 +94,7 @@ class DiagnosisAction(metaclass=ABCMeta):
 
     def to_json(self):
         data = {k.lstrip("_"): v for k, v in self.__dict__.items()}
-        return json.dumps(data)
+        return json_dumps(data)
 
     def update_timestamp(
         self,
@@ -117,7 +117,7 @@ class DiagnosisAction(metaclass=ABCMeta):
 
     @classmethod
     def from_json(cls, json_data):
-        return cls(**json.loads(json_data))
+        return cls(**json_loads(json_data))
 
     def __repr__(self):
         return (
@@ -11,12 +11,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 from abc import ABCMeta
 from datetime import datetime
 from typing import List
 
 from dlock.python.common import env_utils
+from dlock.python.common.serialize import json_dumps, json_loads
 from dlock.python.diagnosis.common.constants import DiagnosisDataType
 
 
@@ -78,11 +78,11 @@ class DiagnosisData(metaclass=ABCMeta):
 
     def to_json(self):
         data = {k.lstrip("_"): v for k, v in self.__dict__.items()}
-        return json.dumps(data)
+        return json_dumps(data)
 
     @classmethod
     def from_json(cls, json_data):
-        return cls(**json.loads(json_data))
+        return cls(**json_loads(json_data))
 
     def is_from_worker(self):
         return self._node_id != -1
@@ -12,8 +12,7 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 
 class InferenceName:
@@ -43,16 +42,42 @@ class InferenceDescription:
     RESOURCE = "resource"
 
 
-@dataclass
 class Inference(object):
     """
     Inference object reflects problems and failures during training.
+    The key is the tuple of name, attribution and description to compare
+    inferences, so those fields should not be changed after creation.
     """
 
-    name: str = ""
-    attribution: str = ""
-    description: str = ""
-    configs: Dict[str, str] = field(default_factory=dict)
+    __slots__ = ("name", "attribution", "description", "configs", "key")
+
+    def __init__(
+        self,
+        name: str = "",
+        attribution: str = "",
+        description: str = "",
+        configs: Optional[Dict[str, str]] = None,
+    ):
+        self.name = name
+        self.attribution = attribution
+        self.description = description
+        self.configs: Dict[str, str] = {} if configs is None else configs
+        self.key: Tuple[str, str, str] = (name, attribution, description)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.key == other.key and self.configs == other.configs
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self):
+        return (
+            f"Inference(name={self.name!r}, "
+            f"attribution={self.attribution!r}, "
+            f"description={self.description!r}, "
+            f"configs={self.configs!r})"
+        )
 
 
 class InferenceOperator(metaclass=ABCMeta):
@@ -78,14 +103,7 @@ class InferenceOperator(metaclass=ABCMeta):
 
 
 def is_same_inference(inference1: Inference, inference2: Inference) -> bool:
-    if (
-        inference1.name == inference2.name
-        and inference1.attribution == inference2.attribution
-        and inference1.description == inference2.description
-    ):
-        return True
-    else:
-        return False
+    return inference1.key == inference2.key
 
 
 def is_inference_included(infs: List[Inference], inf: Inference) -> bool:
@@ -29,10 +29,14 @@ from dlock.python.diagnosis.common.inference_chain import (
     InferenceAttribute,
     InferenceDescription,
     InferenceName,
-    is_same_inference,
 )
 
 _dlock_ctx = Context.singleton_instance()
+_EVENT_KEY = (
+    InferenceName.ACTION,
+    InferenceAttribute.IS,
+    InferenceDescription.EVENT,
+)
 
 
 def coordinate_solutions(
@@ -50,29 +54,25 @@ def coordinate_solutions(
     if len(solutions) == 0:
         return NoAction()
 
-    logger.info(f"coordinate solutions: {solutions}")
-    event_solution = Inference(
-        name=InferenceName.ACTION,
-        attribution=InferenceAttribute.IS,
-        description=InferenceDescription.EVENT,
-    )
+    logger.info("coordinate %d solutions", len(solutions))
+    logger.debug("coordinate solutions: %s", solutions)
     for solution in solutions:
         # deal with event
-        if is_same_inference(solution, event_solution):
+        if solution.key == _EVENT_KEY:
             event_payload = solution.configs
 
-            expired_time_period = (
-                DiagnosisConstant.ACTION_EXPIRED_TIME_PERIOD_DEFAULT
-            )
-            if InferenceConfigKey.EXPIRED_TIME_PERIOD in event_payload:
-                expired_time_period = int(
-                    event_payload[InferenceConfigKey.EXPIRED_TIME_PERIOD]
-                )
-            executable_time_period = 0
-            if InferenceConfigKey.EXECUTABLE_TIME_PERIOD in event_payload:
-                executable_time_period = int(
-                    event_payload[InferenceConfigKey.EXECUTABLE_TIME_PERIOD]
+            expired_time_period = int(
+                event_payload.get(
+                    InferenceConfigKey.EXPIRED_TIME_PERIOD,
+                    DiagnosisConstant.ACTION_EXPIRED_TIME_PERIOD_DEFAULT,
                 )
+            )
+            executable_time_period = int(
+                event_payload.get(InferenceConfigKey.EXECUTABLE_TIME_PERIOD, 0)
+            )
+            event_labels = event_payload[InferenceConfigKey.EVENT_LABELS]
+            if isinstance(event_labels, str):
+                event_labels = json.loads(event_labels)
 
             return EventAction(
                 event_type=event_payload[InferenceConfigKey.EVENT_TYPE],
@@ -81,9 +81,7 @@ def coordinate_solutions(
                 ],
                 event_action=event_payload[InferenceConfigKey.EVENT_ACTION],
                 event_msg=event_payload[InferenceConfigKey.EVENT_MSG],
-                event_labels=json.loads(
-                    event_payload[InferenceConfigKey.EVENT_LABELS]
-                ),
+                event_labels=event_labels,
                 expired_time_period=expired_time_period,
                 executable_time_period=executable_time_period,
             )
@@ -66,5 +66,5 @@ class InferenceChain:
         for operator in self.operators:
             if operator.is_compatible(inference):
                 return operator
-        logger.debug(f"No operator for inference: {inference.__dict__}")
+        logger.debug("No operator for inference: %r", inference)
         return None  # type: ignore
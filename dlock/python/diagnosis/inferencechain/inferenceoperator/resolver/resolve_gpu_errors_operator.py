@@ -11,7 +11,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 from typing import List
 
 from dlock.python.common.constants import ErrorMonitorConstants
@@ -83,7 +82,7 @@ class ResolveGPUErrorsOperator(InferenceOperator):
                         InferenceConfigKey.EVENT_MSG: inf.configs[
                             InferenceConfigKey.LOGS
                         ],
-                        InferenceConfigKey.EVENT_LABELS: json.dumps({}),
+                        InferenceConfigKey.EVENT_LABELS: {},
                         InferenceConfigKey.EXPIRED_TIME_PERIOD: "120",
                     },
                 )
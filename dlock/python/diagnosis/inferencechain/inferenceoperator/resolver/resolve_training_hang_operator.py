@@ -10,7 +10,6 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import json
 from typing import List
 
 from dlock.python.common.constants import ErrorMonitorConstants
@@ -61,7 +60,7 @@ class ResolveTrainingHangOperator(InferenceOperator):
                             "event_instance": ErrorMonitorConstants.JOB_INSTANCE,  # noqa: E501
                             "event_action": ErrorMonitorConstants.ACTION_HANG_WARN,  # noqa: E501
                             "event_msg": "",
-                            "event_labels": json.dumps({}),
+                            "event_labels": {},
                         },
                     )
                 ]
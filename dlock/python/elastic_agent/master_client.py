@@ -11,13 +11,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import importlib
+import functools
 import os
+import queue
+import random
 import socket
 import threading
 import time
+import weakref
 from contextlib import closing
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from dlock.proto import elastic_training_pb2, elastic_training_pb2_grpc
 from dlock.python.common import env_utils, grpc
@@ -29,6 +32,9 @@ from dlock.python.common.constants import (
 )
 from dlock.python.common.log import default_logger as logger
 from dlock.python.common.singleton import Singleton
+from dlock.python.diagnosis.common import (
+    diagnosis_action as _diagnosis_action_module,
+)
 from dlock.python.diagnosis.common.diagnosis_action import (
     DiagnosisAction,
     NoAction,
@@ -36,24 +42,136 @@ from dlock.python.diagnosis.common.diagnosis_action import (
 from dlock.python.diagnosis.common.diagnosis_data import DiagnosisData
 
 
+@functools.lru_cache(maxsize=1)
+def _get_process_env():
+    """Get the node IP and the local rank which are stable in
+    the process."""
+    return os.getenv("NODE_IP", ""), int(os.getenv("LOCAL_RANK", 0))
+
+
+# The expected waiting time of 9 retries is about 49s which is close
+# to the fixed 5s sleeps before.
+_RETRY_BACKOFF_BASE = 1
+_RETRY_BACKOFF_CAP = 10
+# The expected waiting time of 10 retries to get a task is about 158s
+# which is close to the fixed 15s sleeps before.
+_GET_TASK_BACKOFF_BASE = 5
+_GET_TASK_BACKOFF_CAP = 25
+
+
+def retry_backoff_time(
+    retry_index, base=_RETRY_BACKOFF_BASE, cap=_RETRY_BACKOFF_CAP
+):
+    """The seconds to wait before the next retry. It is a capped
+    exponential backoff with equal jitter to avoid that all nodes
+    retry the master at the same time while waiting at least half
+    of the backoff."""
+    delay = min(cap, base * 2**retry_index)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class MasterUnavailableError(Exception):
+    """Raised without calling the master if the circuit breaker
+    of the master client is open."""
+
+    pass
+
+
+class CircuitBreaker(object):
+    """CircuitBreaker stops requesting the master after consecutive
+    failures and fails fast until the reset timeout passes. Then, it
+    allows requests to probe whether the master has recovered.
+
+    Args:
+        fail_threshold (int): the number of consecutive failures
+            to open the breaker.
+        reset_timeout (float): the seconds to keep the breaker open.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        fail_threshold=JobConstant.MASTER_CLIENT_BREAKER_FAIL_THRESHOLD,
+        reset_timeout=JobConstant.MASTER_CLIENT_BREAKER_RESET_TIMEOUT,
+    ):
+        self._fail_threshold = fail_threshold
+        self._reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._fail_count = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        return self._state
+
+    def allow_request(self) -> bool:
+        if self._state != self.OPEN:
+            return True
+        with self._lock:
+            if self._state != self.OPEN:
+                return True
+            if time.time() - self._opened_at < self._reset_timeout:
+                return False
+            self._state = self.HALF_OPEN
+            return True
+
+    def record_success(self):
+        if self._state == self.CLOSED and self._fail_count == 0:
+            return
+        with self._lock:
+            self._state = self.CLOSED
+            self._fail_count = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._fail_count += 1
+            if (
+                self._state == self.HALF_OPEN
+                or self._fail_count >= self._fail_threshold
+            ):
+                if self._state != self.OPEN:
+                    logger.warning(
+                        "Open the circuit breaker of the master client "
+                        f"after {self._fail_count} failures."
+                    )
+                self._state = self.OPEN
+                self._opened_at = time.time()
+
+
 def retry_grpc_request(func):
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        retry = kwargs.get("retry", 10)
-        exception = None
-        for i in range(retry):
+        retry = kwargs.pop("retry", 10)
+        breaker: CircuitBreaker = self._breaker
+        if not breaker.allow_request():
+            raise MasterUnavailableError(
+                f"The master {self._master_addr} is unavailable."
+            )
+        try:
+            result = func(self, *args, **kwargs)
+            breaker.record_success()
+            return result
+        except Exception as e:
+            exception = e
+        for i in range(retry - 1):
+            logger.warning(
+                f"Retry {i} to {self.__class__.__name__}.{func.__name__} "
+                f"with failure {exception}",
+            )
+            time.sleep(retry_backoff_time(i))
             try:
-                return func(self, *args, **kwargs)
+                result = func(self, *args, **kwargs)
+                breaker.record_success()
+                return result
             except Exception as e:
-                class_name = self.__class__.__name__
-                func_name = func.__name__
-                logger.warning(
-                    f"Retry {i} to {class_name}.{func_name} with failure {e}",
-                )
                 exception = e
-                time.sleep(5)
-        if exception:
-            logger.error(exception)
-            raise exception
+        breaker.record_failure()
+        logger.error(exception)
+        raise exception
 
     return wrapper
 
@@ -79,6 +197,7 @@ class MasterClient(Singleton):
     """
 
     _instance_lock = threading.Lock()
+    _build_failed_time = 0.0
 
     def __init__(self, master_addr, node_id, node_type, timeout=5):
         logger.info(
@@ -87,30 +206,62 @@ class MasterClient(Singleton):
         )
         self._timeout = timeout
         self._master_addr = master_addr
+        self._breaker = CircuitBreaker()
         self._channel = grpc.build_channel(master_addr)
         self._stub = elastic_training_pb2_grpc.MasterStub(self._channel)
         self._node_id = node_id
         self._node_type = node_type
-        self._node_ip = os.getenv("NODE_IP", "")
-        self._worker_local_process_id = int(os.getenv("LOCAL_RANK", 0))
-        self._ddp_server_port = self.find_free_port()
-
-        self._diagnosis_action_module = importlib.import_module(
-            "dlock.python.diagnosis.common.diagnosis_action"
+        # the node fields of requests never change during the lifetime
+        # of the client.
+        self._request_template = elastic_training_pb2.Message()
+        self._request_template.node_id = node_id
+        self._request_template.node_type = node_type
+        self._node_ip, self._worker_local_process_id = _get_process_env()
+        # the port is allocated by the component which listens on it.
+        self._ddp_server_port = None
+
+        # The reports without response are sent in batch by a
+        # background thread started with the first report.
+        self._report_queue: queue.Queue = queue.Queue(
+            maxsize=JobConstant.MASTER_CLIENT_REPORT_QUEUE_SIZE
         )
+        self._flush_lock = threading.Lock()
+        self._report_event = threading.Event()
+        self._report_thread: Optional[threading.Thread] = None
+        self._report_thread_lock = threading.Lock()
+        # The reports failed to flush are reported with the next flush
+        # and the error is raised to the next caller of `_report_async`.
+        self._unsent_reports: List[grpc.Message] = []
+        self._report_error: Optional[Exception] = None
+        # Masters of older releases cannot unpickle a BatchReport.
+        self._batch_report_supported = True
+
+        self._diagnosis_action_module = _diagnosis_action_module
+        # cache of the resolved diagnosis action classes by name, the
+        # invalid names are cached as None.
+        self._action_cls_cache: Dict[str, Optional[type]] = {}
 
     def __del__(self):
-        if self._channel:
-            self._channel.close()
+        self.close_channel()
 
     def close_channel(self):
-        if self._channel:
-            self._channel.close()
+        channel = getattr(self, "_channel", None)
+        if channel:
+            channel.close()
+            self._channel = None
 
     def open_channel(self):
+        if grpc.channel_reusable(self._channel):
+            return
         self._channel = grpc.build_channel(self._master_addr)
         self._stub = elastic_training_pb2_grpc.MasterStub(self._channel)
 
+    @property
+    def ddp_server_port(self):
+        if self._ddp_server_port is None:
+            self._ddp_server_port = self.find_free_port()
+        return self._ddp_server_port
+
     def find_free_port(self):
         with closing(
             socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -120,24 +271,104 @@ class MasterClient(Singleton):
             _, port = sock.getsockname()
             return port
 
-    @retry_grpc_request
-    def _report(self, message: grpc.Message):
+    def _build_request(self, message: grpc.Message):
         request = elastic_training_pb2.Message()
-        request.node_id = self._node_id
-        request.node_type = self._node_type
+        request.CopyFrom(self._request_template)
         request.data = message.serialize()
+        return request
+
+    @retry_grpc_request
+    def _report(self, message: grpc.Message):
+        request = self._build_request(message)
         return self._stub.report(request, timeout=self._timeout)
 
     @retry_grpc_request
     def _get(self, message: grpc.Message):
-        request = elastic_training_pb2.Message()
-        request.node_id = self._node_id
-        request.node_type = self._node_type
-        request.data = message.serialize()
+        request = self._build_request(message)
         response = self._stub.get(request, timeout=self._timeout)
+        if not response.data:
+            return None
         res_message = grpc.deserialize_message(response.data)
         return res_message
 
+    def _report_async(self, message: grpc.Message):
+        """Put the message into the queue to report in batch. The message
+        is reported directly if the queue is full.
+
+        Raises:
+            The error of the last failed flush in the background, the
+            failed reports are kept to report with the next flush.
+        """
+        if self._report_thread is None:
+            self._start_report_thread()
+        try:
+            self._report_queue.put_nowait(message)
+        except queue.Full:
+            self._report(message)
+            return
+        self._report_event.set()
+        error, self._report_error = self._report_error, None
+        if error is not None:
+            raise error
+
+    def _start_report_thread(self):
+        with self._report_thread_lock:
+            if self._report_thread is not None:
+                return
+            # The thread only holds a weak reference to the client and
+            # exits after the client is garbage collected.
+            self._report_thread = threading.Thread(
+                target=_flush_reports_periodically,
+                args=(weakref.ref(self), self._report_event),
+                name="master-client-reporter",
+                daemon=True,
+            )
+            self._report_thread.start()
+
+    def flush_reports(self):
+        """Report all queued messages to the master synchronously. The
+        messages not reported by an error are kept in order to report
+        with the next flush."""
+        with self._flush_lock:
+            messages = self._unsent_reports
+            self._unsent_reports = []
+            while True:
+                try:
+                    messages.append(self._report_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not messages:
+                return
+            reported_num = 0
+            try:
+                if len(messages) > 1 and self._batch_report_supported:
+                    response = self._report(
+                        grpc.BatchReport(messages=messages)
+                    )
+                    if response.success:
+                        return
+                    logger.info(
+                        "The master does not support batch reports, "
+                        "report the messages one by one."
+                    )
+                    self._batch_report_supported = False
+                for message in messages:
+                    self._report(message)
+                    reported_num += 1
+            except Exception:
+                self._keep_unsent_reports(messages[reported_num:])
+                raise
+
+    def _keep_unsent_reports(self, messages: List[grpc.Message]):
+        max_num = JobConstant.MASTER_CLIENT_REPORT_QUEUE_SIZE
+        if len(messages) > max_num:
+            logger.warning(
+                f"Drop {len(messages) - max_num} oldest reports "
+                "failed to report to the master."
+            )
+            messages = messages[-max_num:]
+        self._unsent_reports = messages
+
     def kv_store_set(self, key, value):
         message = grpc.KeyValuePair(key, value)
         response = self._report(message)
@@ -165,14 +396,18 @@ class MasterClient(Singleton):
         success = False
         res = None
         exception = None
-        for _ in range(10):
+        for i in range(10):
             try:
                 res = self._get(req)
                 success = True
                 break
             except Exception as e:
                 exception = e
-                time.sleep(15)
+                time.sleep(
+                    retry_backoff_time(
+                        i, _GET_TASK_BACKOFF_BASE, _GET_TASK_BACKOFF_CAP
+                    )
+                )
         if not success:
             logger.warning(exception)
         if not res:
@@ -230,7 +465,7 @@ class MasterClient(Singleton):
 
     def report_used_resource(self, memory, cpu, gpu_stats):
         message = grpc.ResourceStats(memory, cpu, gpu_stats)
-        return self._report(message)
+        self._report_async(message)
 
     def report_model_info(self, model_info):
         self._report(model_info)
@@ -243,7 +478,7 @@ class MasterClient(Singleton):
             step=global_step,
             elapsed_time_per_step=elapsed_time_per_step,
         )
-        return self._report(message)
+        self._report_async(message)
 
     def report_heart_beat(self, timestamp) -> DiagnosisAction:
         message = grpc.HeartBeat(timestamp=timestamp)
@@ -254,10 +489,11 @@ class MasterClient(Singleton):
             logger.warning("No response from heartbeat reporting.")
             return action
 
-        action_cls: Optional[DiagnosisData] = getattr(
-            self._diagnosis_action_module,
-            response.action.action_cls,
-        )
+        # Tolerate a response without action from a custom master.
+        if not response.action.action_cls:
+            return action
+
+        action_cls = self._get_action_cls(response.action.action_cls)
         if action_cls is None:
             logger.warning(
                 "Invalid diagnosis action "
@@ -267,6 +503,13 @@ class MasterClient(Singleton):
             action = action_cls.from_json(response.action.action_content)
         return action
 
+    def _get_action_cls(self, name) -> Optional[type]:
+        if name in self._action_cls_cache:
+            return self._action_cls_cache[name]
+        action_cls = getattr(self._diagnosis_action_module, name, None)
+        self._action_cls_cache[name] = action_cls
+        return action_cls
+
     def get_cluster_version(self, version_type, task_type, task_id):
         request = grpc.ClusterVersionRequest(
             task_type=task_type,
@@ -312,9 +555,11 @@ class MasterClient(Singleton):
         )
 
     def report_failed_exited(self):
+        self.flush_reports()
         return self.report_node_event(NodeEventType.FAILED_EXITED)
 
     def report_succeeded_exited(self):
+        self.flush_reports()
         return self.report_node_event(NodeEventType.SUCCEEDED_EXITED)
 
     def update_cluster_version(
@@ -390,33 +635,45 @@ class MasterClient(Singleton):
 
     def check_fault_node(self, timeout=300):
         request = grpc.NetworkReadyRequest()
-        start = time.time()
-        while True:
-            result: grpc.NetworkCheckResult = self._get(request)
-            if (
-                result.reason == NetworkFailureReason.WAITING_NODE
-                or result.reason == NetworkFailureReason.NO_INIT
-            ) and time.time() - start < timeout:
-                time.sleep(JobConstant.MASTER_CLIENT_CHECK_FAULT_SLEEP_TIMEOUT)
-                continue
-            break
+        result = self._wait_network_check_result(
+            request,
+            (NetworkFailureReason.WAITING_NODE, NetworkFailureReason.NO_INIT),
+            JobConstant.MASTER_CLIENT_CHECK_FAULT_SLEEP_TIMEOUT,
+            timeout,
+        )
         return result.nodes, result.reason
 
     def check_straggler(self, timeout=300):
         request = grpc.StragglerExistRequest()
+        result = self._wait_network_check_result(
+            request,
+            (NetworkFailureReason.WAITING_NODE,),
+            JobConstant.MASTER_CLIENT_CHECK_STRAGGLER_SLEEP_TIMEOUT,
+            timeout,
+        )
+        return result.nodes, result.reason
+
+    def _wait_network_check_result(
+        self, request, waiting_reasons, sleep_time, timeout
+    ) -> grpc.NetworkCheckResult:
+        """Query the network check result until the reason is not in
+        waiting_reasons. The interval between queries doubles up to
+        MASTER_CLIENT_CHECK_NODE_MAX_SLEEP to reduce requests to the
+        master if the check takes a long time."""
         start = time.time()
         while True:
             result: grpc.NetworkCheckResult = self._get(request)
             if (
-                result.reason == NetworkFailureReason.WAITING_NODE
+                result.reason in waiting_reasons
                 and time.time() - start < timeout
             ):
-                time.sleep(
-                    JobConstant.MASTER_CLIENT_CHECK_STRAGGLER_SLEEP_TIMEOUT
+                time.sleep(sleep_time)
+                sleep_time = min(
+                    sleep_time * 2,
+                    JobConstant.MASTER_CLIENT_CHECK_NODE_MAX_SLEEP,
                 )
                 continue
-            break
-        return result.nodes, result.reason
+            return result
 
     def report_rdzv_params(
         self, min_nodes, max_nodes, waiting_timeout, node_unit, joint_timeout
@@ -444,7 +701,7 @@ class MasterClient(Singleton):
             data.to_json(),
             data.node_rank,
         )
-        self._report(message)
+        self._report_async(message)
 
     def get_paral_config(self) -> grpc.ParallelConfig:
         request = grpc.ParallelConfigRequest()
@@ -497,13 +754,55 @@ class MasterClient(Singleton):
 
     @classmethod
     def singleton_instance(cls, *args, **kwargs):
-        if not cls._instance:
-            with cls._instance_lock:
-                if not cls._instance:
-                    cls._instance = build_master_client(*args, **kwargs)
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        # Do not rebuild the client for each call if the master
+        # is not available now.
+        if (
+            time.time() - cls._build_failed_time
+            < JobConstant.MASTER_CLIENT_REBUILD_INTERVAL
+        ):
+            return None
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = build_master_client(*args, **kwargs)
+                if cls._instance is None:
+                    cls._build_failed_time = time.time()
         return cls._instance
 
 
+def _flush_reports_periodically(client_ref, report_event: threading.Event):
+    """Block until a report is queued and flush the reports of the client
+    in batch. The timeout of waiting only checks whether the client is
+    garbage collected.
+
+    The reports are only taken from the queue by `flush_reports` under
+    its lock, so a synchronous flush before an exit event never misses
+    a report which this thread is about to send.
+    """
+    interval = JobConstant.MASTER_CLIENT_REPORT_FLUSH_INTERVAL
+    while True:
+        reported = report_event.wait(
+            timeout=JobConstant.MASTER_CLIENT_REPORT_IDLE_TIMEOUT
+        )
+        if reported:
+            report_event.clear()
+            # Wait a moment to report the following messages together.
+            time.sleep(interval)
+        client = client_ref()
+        if client is None:
+            return
+        if reported:
+            try:
+                client.flush_reports()
+            except Exception as e:
+                logger.warning(f"Fail to flush reports to the master: {e}")
+                client._report_error = e
+        # Do not keep the client alive while waiting for reports.
+        client = None
+
+
 def build_master_client(
     master_addr=None, timeout=JobConstant.MASTER_CLIENT_GRPC_DEFAULT_TIMEOUT
 ):
@@ -520,10 +819,11 @@ def build_master_client(
     node_id = env_utils.get_node_id()
     node_type = env_utils.get_node_type()
 
-    try:
-        _timeout = int(os.getenv(NodeEnv.MASTER_CLIENT_TIMEOUT, ""))
+    env_timeout = os.getenv(NodeEnv.MASTER_CLIENT_TIMEOUT, "")
+    if env_timeout.isdigit():
+        _timeout = int(env_timeout)
         logger.info(f"set master_client timeout to env {_timeout}")
-    except Exception:
+    else:
         _timeout = timeout
         logger.info(f"set master_client timeout to {_timeout}")
 
@@ -532,7 +832,7 @@ def build_master_client(
     if master_addr:
         try:
             master_client = MasterClient(
-                master_addr, node_id, node_type, timeout
+                master_addr, node_id, node_type, _timeout
             )
         except Exception:
             logger.info("The master is not available now.")
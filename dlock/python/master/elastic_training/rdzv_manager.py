@@ -17,7 +17,7 @@ import time
 from abc import ABCMeta, abstractmethod
 from collections import OrderedDict
 from threading import Lock
-from typing import Dict, List, Tuple
+from typing import Dict, List, NamedTuple, Tuple
 
 from dlock.python.common.constants import (
     ErrorMonitorConstants,
@@ -57,6 +57,18 @@ class RendezvousParameters(object):
         self.waiting_timeout = waiting_timeout
 
 
+class RdzvSnapshot(NamedTuple):
+    """An immutable view of the rendezvous state which the manager
+    publishes after each update so that frequent queries can read it
+    without the lock.
+    """
+
+    round: int
+    world: Dict[int, NodeTopologyMeta]
+    groups: Tuple[Dict[int, NodeTopologyMeta], ...]
+    waiting_num: int
+
+
 class RendezvousManager(metaclass=ABCMeta):
     def __init__(self, error_monitor=None):
         self._lock = Lock()
@@ -80,6 +92,20 @@ class RendezvousManager(metaclass=ABCMeta):
         self._topology_querier = DefaultTopologyQuerier()
         self._topology_sorter = DpTopologySorter()
         self._error_monitor = error_monitor
+        self._snapshot = RdzvSnapshot(0, {}, (), 0)
+
+    def _publish_snapshot(self):
+        """Publish the current state. It must be called with the lock held
+        after the rendezvous state changes."""
+        self._snapshot = RdzvSnapshot(
+            self._rdzv_round,
+            self._rdzv_nodes,
+            self._get_node_groups(),
+            self._get_num_nodes_waiting(),
+        )
+
+    def _get_node_groups(self) -> Tuple[Dict[int, NodeTopologyMeta], ...]:
+        return ()
 
     def get_min_nodes(self):
         return self._rdzv_params.min_nodes
@@ -90,6 +116,7 @@ class RendezvousManager(metaclass=ABCMeta):
     def clear_waiting_nodes(self):
         with self._lock:
             self._waiting_nodes.clear()
+            self._publish_snapshot()
 
     def add_alive_node(self, node: Node):
         """When a node is running, the master will add it to alive list."""
@@ -114,6 +141,7 @@ class RendezvousManager(metaclass=ABCMeta):
                         f"with rank {remove_rank} "
                         f"from {self._name} rendezvous."
                     )
+                    self._publish_snapshot()
 
     def update_rdzv_params(
         self, min_nodes, max_nodes, waiting_timeout, node_unit
@@ -138,6 +166,7 @@ class RendezvousManager(metaclass=ABCMeta):
                     f"min_nodes={min_nodes}, max_nodes={max_nodes}, "
                     f"waiting_timeout={waiting_timeout}, node_unit={node_unit}"
                 )
+                self._publish_snapshot()
 
     def _check_rdzv_completed(self):
         rdzv_completed = False
@@ -313,6 +342,7 @@ class RendezvousManager(metaclass=ABCMeta):
                         "node_elapsed_time": f"{node_elapsed_time}",
                     },
                 )
+            self._publish_snapshot()
 
         return self._rdzv_round
 
@@ -341,6 +371,9 @@ class RendezvousManager(metaclass=ABCMeta):
         the next round rendezvous only when the number of waiting nodes
         is bigger than the number unit of nodes.
         """
+        return self._snapshot.waiting_num
+
+    def _get_num_nodes_waiting(self):
         if self._has_node_restart():
             return len(self._waiting_nodes)
         elif len(self._waiting_nodes) >= self._node_unit:
@@ -426,6 +459,10 @@ class ElasticTrainingRendezvousManager(RendezvousManager):
             world: Dict like {0: 8, 1: 8, 2: 8} where the key is the rank ID
             and the value is the local world size of the node.
         """
+        snapshot = self._snapshot
+        if snapshot.world:
+            # The world is fixed until a node joins the next round.
+            return snapshot.round, 0, snapshot.world
         with self._lock:
             if not self._rdzv_nodes:
                 rdzv_completed = self._check_rdzv_completed()
@@ -486,6 +523,7 @@ class ElasticTrainingRendezvousManager(RendezvousManager):
                             "error_message": "",
                         },
                     )
+                self._publish_snapshot()
 
             return self._rdzv_round, 0, self._rdzv_nodes
 
@@ -517,6 +555,11 @@ class NetworkCheckRendezvousManager(RendezvousManager):
         self._check_round = 2
         self._fault_nodes = set()
         self._straggler_nodes = set()
+        # The sequence is increased when the check state changes and the
+        # check results are cached with the sequence to compute them.
+        self._state_seq = 0
+        self._fault_node_result: Tuple[int, List[int], str] = (-1, [], "")
+        self._straggler_result: Tuple[int, List[int], str] = (-1, [], "")
 
     def _get_print_node_groups(self):
         printing_node_groups = []
@@ -526,12 +569,26 @@ class NetworkCheckRendezvousManager(RendezvousManager):
 
         return printing_node_groups
 
+    def _get_node_groups(self):
+        return tuple(self._node_groups)
+
+    def _publish_snapshot(self):
+        self._state_seq += 1
+        super()._publish_snapshot()
+
     def get_comm_world(
         self, node_rank
     ) -> Tuple[int, int, Dict[int, NodeTopologyMeta]]:
         """Return the communication world if a round rendezvous is completed.
         The rendezvous is completed if one of the following conditions.
         """
+        snapshot = self._snapshot
+        if snapshot.groups:
+            # The groups are fixed until a node joins the next round.
+            for i, group in enumerate(snapshot.groups):
+                if node_rank in group:
+                    return snapshot.round, i, group
+            return snapshot.round, 0, snapshot.world
         with self._lock:
             if not self._node_groups:
                 rdzv_completed = self._check_rdzv_completed()
@@ -593,6 +650,7 @@ class NetworkCheckRendezvousManager(RendezvousManager):
                             "error_message": "",
                         },
                     )
+                self._publish_snapshot()
             for i, group in enumerate(self._node_groups):
                 if node_rank in group:
                     return self._rdzv_round, i, group
@@ -680,6 +738,9 @@ class NetworkCheckRendezvousManager(RendezvousManager):
         self._node_times[node_rank] = round(
             min(self._node_times[node_rank], elapsed_time), 3
         )
+        # Invalidate the cached check results after the state is updated.
+        with self._lock:
+            self._state_seq += 1
         if len(self._reported_nodes) == len(self._rdzv_nodes):
             node_status = self._map_node_rank_to_id(self._node_status)
             logger.info(
@@ -730,36 +791,47 @@ class NetworkCheckRendezvousManager(RendezvousManager):
         """Check whether the job has fault nodes. Each task contains 2 rounds
         allgather. If succeeded, the round should be set to the multiples of 2.
         """
+        seq, nodes, reason = self._fault_node_result
+        if seq == self._state_seq:
+            return list(nodes), reason
         with self._lock:
-            if not self._rdzv_nodes:
-                logger.warning(
-                    "Skip check for rdzv_nodes hasn't been initialized."
+            nodes, reason = self._check_fault_node()
+            # All sequence updates hold the lock, so the result is cached
+            # with the sequence of the state it is computed from.
+            self._fault_node_result = (self._state_seq, nodes, reason)
+            return list(nodes), reason
+
+    def _check_fault_node(self):
+        if not self._rdzv_nodes:
+            logger.warning(
+                "Skip check for rdzv_nodes hasn't been initialized."
+            )
+            return [], NetworkFailureReason.NO_INIT
+        reason = ""
+        all_joined = len(self._reported_nodes) >= len(self._rdzv_nodes)
+        if not all_joined:
+            reason = NetworkFailureReason.WAITING_NODE
+        elif len(self._fault_nodes) == 0:
+            for node_rank, status in self._node_status.items():
+                if not status:
+                    self._fault_nodes.add(node_rank)
+            if len(self._fault_nodes) > 0:
+                fault_nodes = {}
+                for rank in self._fault_nodes:
+                    fault_nodes[rank] = self._rdzv_nodes[rank].node_id
+                logger.warning(f"Fault nodes(rank:node_id) are: {fault_nodes}")
+            stragglers = self._detect_stragglers()
+            if not self._fault_nodes and not stragglers:
+                check_round = (
+                    math.ceil(self._rdzv_round / self._check_round)
+                    * self._check_round
                 )
-                return [], NetworkFailureReason.NO_INIT
-            reason = ""
-            all_joined = len(self._reported_nodes) >= len(self._rdzv_nodes)
-            if not all_joined:
-                reason = NetworkFailureReason.WAITING_NODE
-            elif len(self._fault_nodes) == 0:
-                for node_rank, status in self._node_status.items():
-                    if not status:
-                        self._fault_nodes.add(node_rank)
-                if len(self._fault_nodes) > 0:
-                    fault_nodes = {}
-                    for rank in self._fault_nodes:
-                        fault_nodes[rank] = self._rdzv_nodes[rank].node_id
-                    logger.warning(
-                        f"Fault nodes(rank:node_id) are: {fault_nodes}"
-                    )
-                stragglers = self._detect_stragglers()
-                if not self._fault_nodes and not stragglers:
-                    self._rdzv_round = (
-                        math.ceil(self._rdzv_round / self._check_round)
-                        * self._check_round
-                    )
-            if all_joined and len(self._fault_nodes) > 0:
-                reason = NetworkFailureReason.NODE_FAILURE
-            return list(self._fault_nodes), reason
+                if check_round != self._rdzv_round:
+                    self._rdzv_round = check_round
+                    self._publish_snapshot()
+        if all_joined and len(self._fault_nodes) > 0:
+            reason = NetworkFailureReason.NODE_FAILURE
+        return list(self._fault_nodes), reason
 
     def get_straggler(self):
         """Detect whether there is the straggler according to the
@@ -767,16 +839,24 @@ class NetworkCheckRendezvousManager(RendezvousManager):
         time of node is bigger than 2*median_time, the node is
         a straggler.
         """
+        seq, nodes, reason = self._straggler_result
+        if seq == self._state_seq:
+            return list(nodes), reason
         with self._lock:
-            reason = ""
-            if len(self._reported_nodes) < len(self._rdzv_nodes):
-                reason = NetworkFailureReason.WAITING_NODE
-            elif len(self._straggler_nodes) == 0:
-                stragglers = self._detect_stragglers()
-                if stragglers:
-                    logger.warning(f"Straggler: {stragglers}.")
-                self._straggler_nodes.update(stragglers)
-            return list(self._straggler_nodes), reason
+            nodes, reason = self._get_straggler()
+            self._straggler_result = (self._state_seq, nodes, reason)
+            return list(nodes), reason
+
+    def _get_straggler(self):
+        reason = ""
+        if len(self._reported_nodes) < len(self._rdzv_nodes):
+            reason = NetworkFailureReason.WAITING_NODE
+        elif len(self._straggler_nodes) == 0:
+            stragglers = self._detect_stragglers()
+            if stragglers:
+                logger.warning(f"Straggler: {stragglers}.")
+            self._straggler_nodes.update(stragglers)
+        return list(self._straggler_nodes), reason
 
     def _detect_stragglers(self):
         """Detect whether there is the straggler in the job."""
@@ -18,7 +18,7 @@ import threading
 import time
 import traceback
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from dlock.python.common.constants import (
     DistributionStrategy,
@@ -1232,14 +1232,30 @@ class DistributedJobManager(JobManager):
         self, node_type, node_id, timestamp
     ) -> DiagnosisAction:
         with self._lock:
-            node = self._job_context.job_node(node_type, node_id)
-            if node is None:
-                return NoAction()
-            if node.heartbeat_time == 0:
-                logger.info(f"Start receiving heartbeat from node {node_id}")
-            node.heartbeat_time = timestamp
-            self._job_context.update_job_node(node)
-            return self._job_context.next_action(instance=node_id)
+            return self._collect_node_heart_beat(node_type, node_id, timestamp)
+
+    def collect_node_heart_beats(
+        self, heart_beats: List[Tuple[str, int, int]]
+    ) -> List[DiagnosisAction]:
+        with self._lock:
+            return super().collect_node_heart_beats(heart_beats)
+
+    def _collect_one_heart_beat(
+        self, node_type, node_id, timestamp
+    ) -> DiagnosisAction:
+        return self._collect_node_heart_beat(node_type, node_id, timestamp)
+
+    def _collect_node_heart_beat(
+        self, node_type, node_id, timestamp
+    ) -> DiagnosisAction:
+        node = self._job_context.job_node(node_type, node_id)
+        if node is None:
+            return NoAction()
+        if node.heartbeat_time == 0:
+            logger.info(f"Start receiving heartbeat from node {node_id}")
+        node.heartbeat_time = timestamp
+        self._job_context.update_job_node(node)
+        return self._job_context.next_action(instance=node_id)
 
     def update_node_required_info_callback(self):
         self._worker_manager.update_node_required_info(self._nodes_required)
@@ -1252,21 +1268,31 @@ class DistributedJobManager(JobManager):
             node_event: The event from training agent.
         """
 
+        with self._lock:
+            self._process_reported_node_event(node_event)
+
+    def process_reported_node_events(self, node_events: List[NodeEvent]):
+        with self._lock:
+            return super().process_reported_node_events(node_events)
+
+    def _process_one_node_event(self, node_event: NodeEvent):
+        self._process_reported_node_event(node_event)
+
+    def _process_reported_node_event(self, node_event: NodeEvent):
         event_type = node_event.event_type
         node = node_event.node
         node_type = node.type
         node_id = node.id
 
-        with self._lock:
-            target_node = self._job_context.job_node(node_type, node_id)
-            if target_node:
-                logger.info(
-                    f"Node {node_id}({node_type}) reported "
-                    f"status to {event_type}."
-                )
-                target_node.update_reported_status(event_type)
+        target_node = self._job_context.job_node(node_type, node_id)
+        if target_node:
+            logger.info(
+                f"Node {node_id}({node_type}) reported "
+                f"status to {event_type}."
+            )
+            target_node.update_reported_status(event_type)
 
-                self._job_context.update_job_node(target_node)
+            self._job_context.update_job_node(target_node)
 
     def get_node_required_info(self):
         return self._nodes_required
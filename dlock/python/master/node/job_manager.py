@@ -12,10 +12,13 @@
 # limitations under the License.
 
 from abc import ABCMeta, abstractmethod
-from typing import Dict
+from typing import Dict, List, Tuple
 
 from dlock.python.common.log import default_logger as logger
-from dlock.python.diagnosis.common.diagnosis_action import DiagnosisAction
+from dlock.python.diagnosis.common.diagnosis_action import (
+    DiagnosisAction,
+    NoAction,
+)
 from dlock.python.master.hyperparams.simple_strategy_generator import (
     SimpleStrategyGenerator,
 )
@@ -202,6 +205,40 @@ class JobManager(metaclass=ABCMeta):
         """Collect the heart beat message of nodes."""
         pass
 
+    def collect_node_heart_beats(
+        self, heart_beats: List[Tuple[str, int, int]]
+    ) -> List[DiagnosisAction]:
+        """Collect a batch of heart beats.
+
+        Args:
+            heart_beats: the list of (node_type, node_id, timestamp).
+
+        Returns:
+            The diagnosis actions of nodes in the same order. A heart beat
+            failed to collect is logged and gets a `NoAction`.
+        """
+        actions: List[DiagnosisAction] = []
+        for node_type, node_id, timestamp in heart_beats:
+            try:
+                action = self._collect_one_heart_beat(
+                    node_type, node_id, timestamp
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Fail to collect the heartbeat of node "
+                    f"{node_id}({node_type}): {e}"
+                )
+                action = NoAction()
+            actions.append(action)
+        return actions
+
+    def _collect_one_heart_beat(
+        self, node_type, node_id, timestamp
+    ) -> DiagnosisAction:
+        """Collect one heart beat of a batch. The subclass can override it
+        if the batch is already guarded by the lock of the job manager."""
+        return self.collect_node_heart_beat(node_type, node_id, timestamp)
+
     def get_job_nodes(self, node_type=""):
         if node_type == "":
             return self._job_context.job_nodes()
@@ -249,3 +286,27 @@ class JobManager(metaclass=ABCMeta):
         """
 
         pass
+
+    def process_reported_node_events(self, node_events: List[NodeEvent]):
+        """Process a batch of node events in the reported order.
+
+        A failed event is logged and does not stop the following ones.
+        """
+        results = []
+        for node_event in node_events:
+            try:
+                self._process_one_node_event(node_event)
+                results.append(True)
+            except Exception as e:
+                logger.warning(
+                    f"Fail to process the {node_event.event_type} event "
+                    f"of node {node_event.node.id}"
+                    f"({node_event.node.type}): {e}"
+                )
+                results.append(False)
+        return results
+
+    def _process_one_node_event(self, node_event: NodeEvent):
+        """Process one node event of a batch. The subclass can override it
+        if the batch is already guarded by the lock of the job manager."""
+        self.process_reported_node_event(node_event)
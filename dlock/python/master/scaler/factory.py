@@ -13,15 +13,19 @@
 
 from dlock.python.common.constants import PlatformType
 from dlock.python.common.log import default_logger as logger
-from dlock.python.master.scaler.elasticjob_scaler import ElasticJobScaler
-from dlock.python.master.scaler.pod_scaler import PodScaler
 
 
 def new_job_scaler(platform, job_name, namespace):
     logger.info("New %s JobScaler", platform)
     if platform == PlatformType.KUBERNETES:
+        from dlock.python.master.scaler.elasticjob_scaler import (
+            ElasticJobScaler,
+        )
+
         return ElasticJobScaler(job_name, namespace)
     elif platform == PlatformType.PY_KUBERNETES:
+        from dlock.python.master.scaler.pod_scaler import PodScaler
+
         return PodScaler(job_name, namespace)
     elif platform == PlatformType.RAY:
         from dlock.python.master.scaler.ray_scaler import ActorScaler
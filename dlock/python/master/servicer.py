@@ -11,11 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import importlib
+import os
 import threading
 import time
 from concurrent import futures
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import grpc as grpc_lib
 
@@ -25,6 +25,7 @@ from dlock.python.common.constants import (
     GRPC,
     CustomMetricKeys,
     JobConstant,
+    NodeEnv,
     NodeEventType,
     NodeType,
     RendezvousName,
@@ -33,6 +34,10 @@ from dlock.python.common.constants import (
 )
 from dlock.python.common.global_context import Context
 from dlock.python.common.log import default_logger as logger
+from dlock.python.diagnosis.common import (
+    diagnosis_data as _diagnosis_data_module,
+)
+from dlock.python.diagnosis.common.diagnosis_action import NoAction
 from dlock.python.diagnosis.common.diagnosis_data import DiagnosisData
 from dlock.python.master.diagnosis.diagnosis_manager import DiagnosisManager
 from dlock.python.master.elastic_training.kv_store_service import (
@@ -49,7 +54,7 @@ from dlock.python.master.shard.dataset_splitter import new_dataset_splitter
 from dlock.python.master.shard.task_manager import TaskManager
 from dlock.python.master.stats.job_collector import JobMetricCollector
 from dlock.python.master.watcher.base_watcher import Node, NodeEvent
-from dlock.python.util.queue.queue import RayEventQueue
+from dlock.python.util.queue.queue import BatchingQueue, RayEventQueue
 
 try:
     from dlock.python.master.elastic_training.elastic_ps import (
@@ -63,7 +68,15 @@ except ImportError:
 
 _dlock_context = Context.singleton_instance()
 _DEFAULT_NUM_MINIBATCHES_PER_SHARD = 100
+# The minimum seconds between two collections of the runtime stats.
+_RUNTIME_STATS_INTERVAL = 0.2
 ray_event_queue = RayEventQueue.singleton_instance()
+# The responses are only serialized and never modified.
+_TRAINING_STATUS_START = grpc.TrainingStatus(status=TrainingLoopStatus.START)
+_TRAINING_STATUS_PENDING = grpc.TrainingStatus(
+    status=TrainingLoopStatus.PENDING
+)
+_EMPTY_GET_RESPONSE = elastic_training_pb2.Message()
 
 
 class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
@@ -85,73 +98,161 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
         self._job_manager: JobManager = job_manager
         self._speed_monitor = speed_monitor
         self._rdzv_managers = rdzv_managers
+        self._net_rdzv_manager: Optional[NetworkCheckRendezvousManager] = (
+            rdzv_managers.get(RendezvousName.NETWORK_CHECK)
+        )
+        self._training_rdzv_manager: Optional[RendezvousManager] = (
+            rdzv_managers.get(RendezvousName.ELASTIC_TRAINING)
+        )
         self._diagnosis_manager = diagnosis_manager
         self._kv_store = KVStoreService()
         self._job_metric_collector: JobMetricCollector = job_metric_collector
         self._elastic_ps_service: ElasticPsService = elastic_ps_service
         self._sync_service: SyncService = sync_service
-        self._lock = threading.Lock()
+        self._autoscale_lock = threading.Lock()
         self._version = 0
         self._start_training_time = 0
         self._start_autoscale = False
         self._error_monitor = error_monitor
 
-        # preload module for class reflection
-        self._diagnosis_data_module = importlib.import_module(
-            "dlock.python.diagnosis.common.diagnosis_data"
-        )
+        # resolve the reported data class by name without reflection
+        self._diagnosis_data_classes: Dict[str, type] = {
+            name: cls
+            for name, cls in vars(_diagnosis_data_module).items()
+            if isinstance(cls, type) and issubclass(cls, DiagnosisData)
+        }
         # clear kv store in case previous data is still there
         self._kv_store.clear()
 
+        # Coalesce the concurrent heartbeats and node events to update
+        # the job nodes with one lock acquisition per batch.
+        self._heartbeat_queue = BatchingQueue(
+            self._job_manager.collect_node_heart_beats,
+            name="heartbeat-batching",
+        )
+        self._node_event_queue = BatchingQueue(
+            self._job_manager.process_reported_node_events,
+            name="node-event-batching",
+        )
+        # NoAction only differs by its timestamp in seconds, so the
+        # heartbeats in the same second share one response.
+        self._no_action_response: Tuple[int, grpc.HeartbeatResponse] = (
+            0,
+            grpc.HeartbeatResponse(),
+        )
+
+        # The global steps reported during one interval are coalesced
+        # into one collection of the runtime stats.
+        self._runtime_stats_event = threading.Event()
+        threading.Thread(
+            target=self._periodically_collect_runtime_stats,
+            name="runtime-stats-collector",
+            daemon=True,
+        ).start()
+
+        # The handlers are called with (node_type, node_id, message)
+        # by the exact type of the request message.
+        self._get_handlers: Dict[type, Callable] = {
+            grpc.TaskRequest: self._get_task,
+            grpc.ShardCheckpointRequest: (
+                lambda t, i, m: self._get_shard_checkpoint(m)
+            ),
+            grpc.ClusterVersionRequest: (
+                lambda t, i, m: self._get_cluster_version(m)
+            ),
+            grpc.RunningNodesRequest: (
+                lambda t, i, m: self._get_running_nodes()
+            ),
+            grpc.JoinRendezvousRequest: (
+                lambda t, i, m: self._join_rendezvous(m)
+            ),
+            grpc.WaitingNodeNumRequest: (
+                lambda t, i, m: self._num_nodes_waiting(m.rdzv_name)
+            ),
+            grpc.NetworkReadyRequest: (
+                lambda t, i, m: self._check_fault_node()
+            ),
+            grpc.StragglerExistRequest: (
+                lambda t, i, m: self._check_straggler()
+            ),
+            grpc.CommWorldRequest: lambda t, i, m: self._get_comm_world(m),
+            grpc.KeyValuePair: lambda t, i, m: self._kv_store_get(m),
+            grpc.PsNodesRequest: lambda t, i, m: self._query_ps_nodes(),
+            grpc.TrainingStatusRequest: (
+                lambda t, i, m: self._get_training_status()
+            ),
+            grpc.ParallelConfigRequest: (
+                lambda t, i, m: self._get_paral_config()
+            ),
+            grpc.CheckHardwareResetRequest: (
+                lambda t, i, m: self._need_to_restart_training(t, i)
+            ),
+            grpc.SyncTrainingPort: (
+                lambda t, i, m: self._sync_training_ports(i, m)
+            ),
+            grpc.ElasticRunConfigRequest: (
+                lambda t, i, m: self._get_elastic_run_config()
+            ),
+            grpc.HeartBeat: self._report_heartbeat,
+        }
+        self._report_handlers: Dict[type, Callable] = {
+            grpc.DatasetShardParams: (
+                lambda t, i, m: self._collect_dataset_shard_params(m)
+            ),
+            grpc.ResourceStats: self._update_node_resource_usage,
+            grpc.ModelInfo: lambda t, i, m: self._collect_model_info(m),
+            grpc.GlobalStep: lambda t, i, m: self._collect_global_step(m),
+            grpc.ShardCheckpoint: (
+                lambda t, i, m: self._restore_shard_checkpoint(m)
+            ),
+            grpc.TaskResult: lambda t, i, m: self._report_task_result(m),
+            grpc.ClusterVersion: (
+                lambda t, i, m: self._update_cluster_version(m)
+            ),
+            grpc.NodeAddress: lambda t, i, m: self._update_node_address(m),
+            grpc.NodeEvent: (
+                lambda t, i, m: self._deal_with_reported_node_event(m)
+            ),
+            grpc.SyncJoin: self._join_sync,
+            grpc.SyncFinish: lambda t, i, m: self._sync_finished(m),
+            grpc.SyncBarrier: lambda t, i, m: self._barrier(m),
+            grpc.NodeFailure: self._report_failure,
+            grpc.RendezvousParams: (
+                lambda t, i, m: self._report_rdzv_params(m)
+            ),
+            grpc.PsReady: lambda t, i, m: self._ready_for_ps_relaunch(),
+            grpc.KeyValuePair: lambda t, i, m: self._kv_store_set(m),
+            grpc.ParallelConfig: self._report_paral_config,
+            grpc.NodeCheckpointState: self._sync_checkpoint,
+            grpc.DiagnosisReportData: (
+                lambda t, i, m: self._report_node_diagnosis_data(m)
+            ),
+            grpc.Event: lambda t, i, m: self._report_event(m),
+            grpc.BatchReport: self._report_batch,
+        }
+
     def get(self, request, _):
         node_type = request.node_type
         node_id = request.node_id
         req_message = grpc.deserialize_message(request.data)
 
-        response = elastic_training_pb2.Message()
         if not req_message:
-            return response
+            return _EMPTY_GET_RESPONSE
         message = None
-        if isinstance(req_message, grpc.TaskRequest):
-            message = self._get_task(node_type, node_id, req_message)
-        elif isinstance(req_message, grpc.ShardCheckpointRequest):
-            message = self._get_shard_checkpoint(req_message)
-        elif isinstance(req_message, grpc.ClusterVersionRequest):
-            message = self._get_cluster_version(req_message)
-        elif isinstance(req_message, grpc.RunningNodesRequest):
-            message = self._get_running_nodes()
-        elif isinstance(req_message, grpc.JoinRendezvousRequest):
-            message = self._join_rendezvous(req_message)
-        elif isinstance(req_message, grpc.WaitingNodeNumRequest):
-            message = self._num_nodes_waiting(req_message.rdzv_name)
-        elif isinstance(req_message, grpc.NetworkReadyRequest):
-            message = self._check_fault_node()
-        elif isinstance(req_message, grpc.StragglerExistRequest):
-            message = self._check_straggler()
-        elif isinstance(req_message, grpc.CommWorldRequest):
-            message = self._get_comm_world(req_message)
-        elif isinstance(req_message, grpc.KeyValuePair):
-            message = self._kv_store_get(req_message)
-        elif isinstance(req_message, grpc.PsNodesRequest):
-            message = self._query_ps_nodes()
-        elif isinstance(req_message, grpc.TrainingStatusRequest):
-            message = self._get_training_status()
-        elif isinstance(req_message, grpc.ParallelConfigRequest):
-            message = self._get_paral_config()
-        elif isinstance(req_message, grpc.CheckHardwareResetRequest):
-            message = self._need_to_restart_training(node_type, node_id)
-        elif isinstance(req_message, grpc.SyncTrainingPort):
-            message = self._sync_training_ports(node_id, req_message)
-        elif isinstance(req_message, grpc.ElasticRunConfigRequest):
-            configs = self._job_manager.get_elastic_run_configs()
-            message = grpc.ElasticRunConfig(configs=configs)
-        elif isinstance(req_message, grpc.HeartBeat):
-            message = self._report_heartbeat(node_type, node_id, req_message)
-
-        if message:
-            response.data = message.serialize()
+        handler = self._get_handlers.get(type(req_message))
+        if handler:
+            message = handler(node_type, node_id, req_message)
+
+        if not message:
+            return _EMPTY_GET_RESPONSE
+        response = elastic_training_pb2.Message()
+        response.data = message.serialize()
         return response
 
+    def _get_elastic_run_config(self):
+        configs = self._job_manager.get_elastic_run_configs()
+        return grpc.ElasticRunConfig(configs=configs)
+
     def _get_task(self, node_type, node_id, request: grpc.TaskRequest):
         if not self._start_training_time:
             self._start_training_time = int(time.time())
@@ -166,15 +267,15 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
         if task:
             res.task_id = task.task_id
             res.type = task.task_type
-            res.shard.name = task.shard.name
-            res.shard.start = task.shard.start
-            res.shard.end = task.shard.end
-            if task.shard.record_indices:
-                res.shard.indices = task.shard.record_indices
+            task_shard = task.shard
+            shard.name = task_shard.name
+            shard.start = task_shard.start
+            shard.end = task_shard.end
+            if task_shard.record_indices:
+                shard.indices = task_shard.record_indices
         elif not dataset.completed():
             res.type = elastic_training_pb2.WAIT
-        with self._lock:
-            self._task_manager.reset_worker_start_task_time(node_id)
+        self._task_manager.reset_worker_start_task_time(node_id)
         return res
 
     def _get_shard_checkpoint(self, request: grpc.ShardCheckpointRequest):
@@ -201,57 +302,53 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
         return message
 
     def _query_ps_nodes(self):
-        res = grpc.PsNodes(nodes=[])
         training_ps: List[Node] = self._job_manager.get_next_cluster_ps()
         ready = self._job_manager.ready_for_new_ps_cluster()
         ps_failure = self._job_manager.has_ps_failure()
+        nodes = []
         for ps in training_ps:
-            ps_meta = grpc.NodeMeta()
-            ps_meta.type = NodeType.PS
-            ps_meta.addr = ps.service_addr
-            ps_meta.cpu = ps.config_resource.cpu
-            ps_meta.memory = int(ps.config_resource.memory)
-            res.nodes.append(ps_meta)
-        res.new_ps_ready = ready
-        res.ps_failure = ps_failure
-        return res
+            resource = ps.config_resource
+            nodes.append(
+                grpc.NodeMeta(
+                    type=NodeType.PS,
+                    addr=ps.service_addr,
+                    cpu=resource.cpu,
+                    memory=int(resource.memory),
+                )
+            )
+        return grpc.PsNodes(
+            nodes=nodes, new_ps_ready=ready, ps_failure=ps_failure
+        )
 
     def _get_running_nodes(self):
-        res = grpc.RunningNodes(nodes=[])
         nodes: List[Node] = self._job_manager.get_running_nodes()
+        metas = []
         for node in nodes:
-            meta = grpc.NodeMeta()
-            meta.type = node.type
-            meta.addr = node.service_addr
-            meta.cpu = node.config_resource.cpu
-            meta.memory = node.config_resource.memory
-            if node.config_resource.gpu_type:
-                meta.gpu_type = node.config_resource.gpu_type
-                meta.gpu = node.config_resource.gpu_num
-            res.nodes.append(meta)
-        return res
+            resource = node.config_resource
+            meta = grpc.NodeMeta(
+                type=node.type,
+                addr=node.service_addr,
+                cpu=resource.cpu,
+                memory=resource.memory,
+            )
+            if resource.gpu_type:
+                meta.gpu_type = resource.gpu_type
+                meta.gpu = resource.gpu_num
+            metas.append(meta)
+        return grpc.RunningNodes(nodes=metas)
 
     def _get_training_status(self):
-        res = grpc.TrainingStatus()
         if self._task_manager.training_started():
-            res.status = TrainingLoopStatus.START
-        else:
-            res.status = TrainingLoopStatus.PENDING
-        return res
+            return _TRAINING_STATUS_START
+        return _TRAINING_STATUS_PENDING
 
     def _check_fault_node(self):
-        rdzv_manager: NetworkCheckRendezvousManager = self._rdzv_managers[
-            RendezvousName.NETWORK_CHECK
-        ]
-        nodes, reason = rdzv_manager.check_fault_node()
+        nodes, reason = self._net_rdzv_manager.check_fault_node()
         res = grpc.NetworkCheckResult(nodes=nodes, reason=reason)
         return res
 
     def _check_straggler(self):
-        rdzv_manager: NetworkCheckRendezvousManager = self._rdzv_managers[
-            RendezvousName.NETWORK_CHECK
-        ]
-        nodes, reason = rdzv_manager.get_straggler()
+        nodes, reason = self._net_rdzv_manager.get_straggler()
         res = grpc.NetworkCheckResult(nodes=nodes, reason=reason)
         return res
 
@@ -269,10 +366,7 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
         if request.rdzv_name == RendezvousName.NETWORK_CHECK:
             # The waiting node in the training rdzv should clear if
             # a worker join network-check rdzv.
-            training_manager = self._rdzv_managers[
-                RendezvousName.ELASTIC_TRAINING
-            ]
-            training_manager.clear_waiting_nodes()
+            self._training_rdzv_manager.clear_waiting_nodes()
         res = grpc.RendezvousState(round=round)
         return res
 
@@ -323,53 +417,27 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
         if not message:
             return response
 
-        success = False
-        if isinstance(message, grpc.DatasetShardParams):
-            success = self._collect_dataset_shard_params(message)
-        elif isinstance(message, grpc.ResourceStats):
-            success = self._update_node_resource_usage(
-                node_type, node_id, message
-            )
-        elif isinstance(message, grpc.ModelInfo):
-            success = self._collect_model_info(message)
-        elif isinstance(message, grpc.GlobalStep):
-            success = self._collect_global_step(message)
-        elif isinstance(message, grpc.ShardCheckpoint):
-            success = self._restore_shard_checkpoint(message)
-        elif isinstance(message, grpc.TaskResult):
-            success = self._report_task_result(message)
-        elif isinstance(message, grpc.ClusterVersion):
-            success = self._update_cluster_version(message)
-        elif isinstance(message, grpc.NodeAddress):
-            success = self._update_node_address(message)
-        elif isinstance(message, grpc.NodeEvent):
-            success = self._deal_with_reported_node_event(message)
-        elif isinstance(message, grpc.SyncJoin):
-            success = self._join_sync(node_type, node_id, message)
-        elif isinstance(message, grpc.SyncFinish):
-            success = self._sync_finished(message)
-        elif isinstance(message, grpc.SyncBarrier):
-            success = self._barrier(message)
-        elif isinstance(message, grpc.NodeFailure):
-            success = self._report_failure(node_type, node_id, message)
-        elif isinstance(message, grpc.RendezvousParams):
-            success = self._report_rdzv_params(message)
-        elif isinstance(message, grpc.PsReady):
-            success = self._ready_for_ps_relaunch()
-        elif isinstance(message, grpc.KeyValuePair):
-            success = self._kv_store_set(message)
-        elif isinstance(message, grpc.ParallelConfig):
-            success = self._report_paral_config(node_type, node_id, message)
-        elif isinstance(message, grpc.NodeCheckpointState):
-            success = self._sync_checkpoint(node_type, node_id, message)
-        elif isinstance(message, grpc.DiagnosisReportData):
-            success = self._report_node_diagnosis_data(message)
-        elif isinstance(message, grpc.Event):
-            success = self._report_event(message)
-
+        success = self._dispatch_report(node_type, node_id, message)
         response.success = success
         return response
 
+    def _dispatch_report(self, node_type, node_id, message) -> bool:
+        handler = self._report_handlers.get(type(message))
+        if not handler:
+            return False
+        return handler(node_type, node_id, message)
+
+    def _report_batch(self, node_type, node_id, message: grpc.BatchReport):
+        # The success only tells the agent that the batch is supported,
+        # otherwise it reports the messages again one by one.
+        for sub_message in message.messages:
+            if not self._dispatch_report(node_type, node_id, sub_message):
+                logger.warning(
+                    f"Fail to process the {type(sub_message).__name__} "
+                    f"in the batch report of node {node_id}({node_type})."
+                )
+        return True
+
     def _ready_for_ps_relaunch(self):
         self._job_manager.post_ps_ready()
         return True
@@ -411,9 +479,12 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
         self, node_type, node_id, metrics: grpc.ResourceStats
     ):
         logger.debug(
-            f"Update resource usage for {node_type}-{node_id},"
-            f"cpu={metrics.cpu}, memory={metrics.memory},"
-            f"gpu_stats={metrics.gpu_stats}"
+            "Update resource usage for %s-%s,cpu=%s, memory=%s,gpu_stats=%s",
+            node_type,
+            node_id,
+            metrics.cpu,
+            metrics.memory,
+            metrics.gpu_stats,
         )
         if self._job_manager:
             self._job_manager.update_node_resource_usage(
@@ -434,10 +505,20 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
         self._speed_monitor.collect_global_step(
             metrics.step, metrics.timestamp
         )
-        self._collect_runtime_stats()
-        self._check_start_auto_scale_worker()
+        self._runtime_stats_event.set()
         return True
 
+    def _periodically_collect_runtime_stats(self):
+        while True:
+            self._runtime_stats_event.wait()
+            self._runtime_stats_event.clear()
+            try:
+                self._collect_runtime_stats()
+                self._check_start_auto_scale_worker()
+            except Exception as e:
+                logger.warning(f"Fail to collect the runtime stats: {e}")
+            time.sleep(_RUNTIME_STATS_INTERVAL)
+
     def _restore_shard_checkpoint(self, message: grpc.ShardCheckpoint):
         success = self._task_manager.restore_dataset_from_checkpoint(
             message.content
@@ -461,12 +542,10 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
             not self._start_autoscale
             and self._job_manager
             and self._speed_monitor.completed_global_step == 0
-            and int(time.time()) - self._start_training_time
+            and time.time() - self._start_training_time
             > _dlock_context.seconds_to_autoscale_worker
         ):
-            logger.info("Start autoscale for non-training jobs")
-            self._job_manager.start_auto_scaling()
-            self._start_autoscale = True
+            self._start_auto_scaling("Start autoscale for non-training jobs")
 
         if (
             self._job_metric_collector
@@ -483,10 +562,17 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
             not self._start_autoscale
             and sample_count >= _dlock_context.sample_count_to_adjust_worker
         ):
-            logger.info(
-                "Start autoscale with %s stats samples",
-                sample_count,
+            self._start_auto_scaling(
+                "Start autoscale with %s stats samples", sample_count
             )
+
+    def _start_auto_scaling(self, msg, *args):
+        # The RPC threads and the runtime stats thread may pass the
+        # check concurrently and only one of them starts the autoscaling.
+        with self._autoscale_lock:
+            if self._start_autoscale:
+                return
+            logger.info(msg, *args)
             self._job_manager.start_auto_scaling()
             self._start_autoscale = True
 
@@ -522,9 +608,7 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
 
         # let rdzv manager deal with rendezvous issue
         if event.is_node_check_event():
-            net_rdzv_manager = self._rdzv_managers.get(
-                RendezvousName.NETWORK_CHECK, None
-            )
+            net_rdzv_manager = self._net_rdzv_manager
             if net_rdzv_manager:
                 succeed = (
                     event.event_type == NodeEventType.NODE_CHECK_SUCCEEDED
@@ -533,9 +617,11 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
                     node.rank_index, succeed, message.event_elapsed_time
                 )
 
-        # let job manager deal with node issue
-        self._job_manager.process_reported_node_event(event)
-        return True
+        # let job manager deal with node issue. The event is applied in
+        # batch but the RPC waits for it, so the state read after the
+        # reporting, like the node check status of `should_early_stop` or
+        # the exited status of the pod watcher, always contains it.
+        return self._node_event_queue.submit(event)
 
     def _join_sync(self, node_type, node_id, message: grpc.SyncJoin):
         success = False
@@ -616,16 +702,15 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
     def _sync_checkpoint(
         self, node_type, node_id, message: grpc.NodeCheckpointState
     ):
-        if RendezvousName.ELASTIC_TRAINING not in self._rdzv_managers:
+        rdzv_manager = self._training_rdzv_manager
+        if rdzv_manager is None:
             return False
-        rdzv_manager = self._rdzv_managers[RendezvousName.ELASTIC_TRAINING]
         return rdzv_manager.sync_ckpt_nodes(node_id, message.step)
 
     def _report_node_diagnosis_data(self, message: grpc.DiagnosisReportData):
         if self._diagnosis_manager:
-            data_cls: Optional[DiagnosisData] = getattr(
-                self._diagnosis_data_module,
-                message.data_cls,
+            data_cls: Optional[DiagnosisData] = (
+                self._diagnosis_data_classes.get(message.data_cls)
             )
             if data_cls is None:
                 logger.warning(
@@ -640,7 +725,7 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
     def _sync_training_ports(
         self, node_id, message: grpc.SyncTrainingPort
     ) -> grpc.SyncTrainingPort:
-        logger.info(f"try to sync port {message.port} from {node_id}")
+        logger.info("try to sync port %s from %s", message.port, node_id)
         sync_ports: SyncNodeTrainingPorts = (
             self._job_manager.sync_node_training_port(node_id, message.port)
         )
@@ -662,15 +747,30 @@ class MasterServicer(elastic_training_pb2_grpc.MasterServicer):
     def _report_heartbeat(
         self, node_type, node_id, message: grpc.HeartBeat
     ) -> grpc.HeartbeatResponse:
-        action = self._job_manager.collect_node_heart_beat(
-            node_type, node_id, message.timestamp
+        action = self._heartbeat_queue.submit(
+            (node_type, node_id, message.timestamp)
         )
+        if isinstance(action, NoAction):
+            return self._get_no_action_response(action)
         grpc_action = grpc.DiagnosisAction(
             action.__class__.__name__,
             action.to_json(),
         )
         return grpc.HeartbeatResponse(action=grpc_action)
 
+    def _get_no_action_response(
+        self, action: NoAction
+    ) -> grpc.HeartbeatResponse:
+        timestamp, response = self._no_action_response
+        if timestamp != action.timestamp:
+            grpc_action = grpc.DiagnosisAction(
+                action.__class__.__name__,
+                action.to_json(),
+            )
+            response = grpc.HeartbeatResponse(action=grpc_action)
+            self._no_action_response = (action.timestamp, response)
+        return response
+
 
 def create_master_service(
     port,
@@ -686,15 +786,27 @@ def create_master_service(
 ) -> MasterServicer:
     """Create GRPC server"""
     logger.info("Creating master service")
+    max_workers = GRPC.MASTER_SERVER_MAX_WORKERS_DEFAULT
+    env_max_workers = os.getenv(NodeEnv.MASTER_SERVER_MAX_WORKERS, "")
+    if env_max_workers.isdigit() and int(env_max_workers) > 0:
+        max_workers = int(env_max_workers)
+    logger.info(f"The master serves requests with {max_workers} threads.")
     server = grpc_lib.server(
-        futures.ThreadPoolExecutor(max_workers=64),
+        futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dlock-master-rpc"
+        ),
         options=[
             ("grpc.max_send_message_length", GRPC.MAX_SEND_MESSAGE_LENGTH),
             (
                 "grpc.max_receive_message_length",
                 GRPC.MAX_RECEIVE_MESSAGE_LENGTH,
             ),
+            ("grpc.max_concurrent_streams", GRPC.MAX_CONCURRENT_STREAMS),
         ],
+        # Fail fast when overloaded so the client retries with backoff
+        # instead of waiting in an unbounded queue.
+        maximum_concurrent_rpcs=max_workers
+        + GRPC.MASTER_SERVER_MAX_PENDING_RPCS,
     )
     master_servicer = MasterServicer(
         task_manager=task_manager,
@@ -11,11 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
 from abc import ABCMeta, abstractmethod
 from typing import Dict, List
 
 from dlock.proto import elastic_training_pb2
+from dlock.python.common.serialize import json_dumps, json_loads
 from dlock.python.master.shard.dataset_splitter import DatasetSplitter, Shard
 
 
@@ -82,11 +82,11 @@ class DatasetShardCheckpoint(object):
         self.splitter = splitter
 
     def to_json(self):
-        return json.dumps(self.__dict__)
+        return json_dumps(self.__dict__)
 
     @classmethod
     def from_json(cls, checkpoint_str):
-        checkpoint_dict = json.loads(checkpoint_str)
+        checkpoint_dict = json_loads(checkpoint_str)
         return DatasetShardCheckpoint(**checkpoint_dict)
 
 
@@ -12,7 +12,6 @@
 # limitations under the License.
 
 import copy
-import inspect
 import math
 import random
 from abc import ABCMeta, abstractmethod
@@ -322,6 +321,12 @@ class TextDatasetSplitter(DatasetSplitter):
         return shards
 
 
+_SPLITTER_CLASSES = {
+    TableDatasetSplitter.STORAGE_TYPE: TableDatasetSplitter,
+    TextDatasetSplitter.STORAGE_TYPE: TextDatasetSplitter,
+}
+
+
 def new_dataset_splitter(
     shuffle,
     shard_size,
@@ -330,30 +335,29 @@ def new_dataset_splitter(
     dataset_name,
     storage_type=None,
 ):
-    frame = inspect.currentframe()
-    args, _, _, values = inspect.getargvalues(frame)
     logger.info(
         "New a datast splitter with: %s",
-        [(i, values[i]) for i in args],
+        [
+            ("shuffle", shuffle),
+            ("shard_size", shard_size),
+            ("dataset_size", dataset_size),
+            ("num_epochs", num_epochs),
+            ("dataset_name", dataset_name),
+            ("storage_type", storage_type),
+        ],
+    )
+    splitter_cls = _SPLITTER_CLASSES.get(
+        storage_type or TableDatasetSplitter.STORAGE_TYPE
+    )
+    if splitter_cls is None:
+        raise ValueError(f"Not support dataset storage {storage_type}")
+    return splitter_cls(
+        dataset_name=dataset_name,
+        dataset_size=dataset_size,
+        shard_size=shard_size,
+        num_epochs=num_epochs,
+        shuffle=shuffle,
     )
-    if not storage_type or storage_type == TableDatasetSplitter.STORAGE_TYPE:
-        return TableDatasetSplitter(
-            dataset_name=dataset_name,
-            dataset_size=dataset_size,
-            shard_size=shard_size,
-            num_epochs=num_epochs,
-            shuffle=shuffle,
-        )
-    elif storage_type == TextDatasetSplitter.STORAGE_TYPE:
-        return TextDatasetSplitter(
-            dataset_name=dataset_name,
-            dataset_size=dataset_size,
-            shard_size=shard_size,
-            num_epochs=num_epochs,
-            shuffle=shuffle,
-        )
-    else:
-        raise ValueError("Not support dataset storage %s", storage_type)
 
 
 class StreamingDatasetSplitter(DatasetSplitter):
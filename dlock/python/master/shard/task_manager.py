@@ -115,7 +115,7 @@ class TaskManager(object):
                     self._speed_monitor.add_running_worker(node_type, node_id)
                     self._speed_monitor.update_worker_eval_time(node_id)
                     self._paral_eval_started = False
-                self._worker_start_task_time[node_id] = time.time()
+                self._worker_start_task_time[node_id] = time.monotonic()
                 return task
             else:
                 return None
@@ -138,7 +138,9 @@ class TaskManager(object):
                 )
             success, doing_task = dataset.report_task_status(task_id, success)
             if success:
-                self._worker_start_task_time[doing_task.node_id] = time.time()
+                self._worker_start_task_time[
+                    doing_task.node_id
+                ] = time.monotonic()
                 return doing_task.task, doing_task.node_id
             return None, None
 
@@ -204,7 +206,8 @@ class TaskManager(object):
             ).start()
 
     def reset_worker_start_task_time(self, worker_id):
-        self._worker_start_task_time[worker_id] = time.time()
+        # The assignment of a dict item is atomic and needs no lock.
+        self._worker_start_task_time[worker_id] = time.monotonic()
 
     def set_task_timeout_callback(self, callback_fn):
         self._task_timeout_callbacks.append(callback_fn)
@@ -221,7 +224,7 @@ class TaskManager(object):
                 # Copy doing task list because the doing list will pop items
                 # in the following loop.
                 doing_tasks = dataset.doing.copy()
-                cur = time.time()
+                cur = time.monotonic()
                 for task_id, doing_task in doing_tasks.items():
                     start = self._worker_start_task_time.get(
                         doing_task.node_id, cur
@@ -0,0 +1,94 @@
+# Copyright 2024 The DLRover Authors. All rights reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import unittest
+from unittest import mock
+
+from dlock.proto import elastic_training_pb2, elastic_training_pb2_grpc
+from dlock.python.common import grpc
+from dlock.python.common.constants import JobConstant, NodeEventType
+from dlock.python.elastic_agent.master_client import MasterClient
+
+
+class MasterClientReportTest(unittest.TestCase):
+    def setUp(self):
+        with mock.patch.object(
+            grpc, "build_channel", return_value=None
+        ), mock.patch.object(elastic_training_pb2_grpc, "MasterStub"):
+            self._client = MasterClient("localhost:0", 0, "worker")
+        self._reports = []
+        self._batch_supported = True
+        self._client._report = self._record_report
+
+    def _record_report(self, message):
+        self._reports.append(message)
+        response = elastic_training_pb2.Response()
+        response.success = self._batch_supported or not isinstance(
+            message, grpc.BatchReport
+        )
+        return response
+
+    def _reported_types(self):
+        types = []
+        for message in self._reports:
+            if isinstance(message, grpc.BatchReport):
+                types.extend(type(m) for m in message.messages)
+            else:
+                types.append(type(message))
+        return types
+
+    @mock.patch.object(JobConstant, "MASTER_CLIENT_REPORT_FLUSH_INTERVAL", 0.5)
+    def test_flush_reports_before_exited(self):
+        self._client.report_global_step(100, int(time.time()))
+        # The reporter thread is waiting to batch the global step.
+        time.sleep(0.1)
+        self._client.report_succeeded_exited()
+        self.assertEqual(
+            self._reported_types(), [grpc.GlobalStep, grpc.NodeEvent]
+        )
+        self.assertEqual(
+            self._reports[-1].event_type, NodeEventType.SUCCEEDED_EXITED
+        )
+
+        # The reporter thread finds nothing left to report.
+        time.sleep(0.6)
+        self.assertEqual(len(self._reports), 2)
+
+    def test_report_one_by_one_to_old_master(self):
+        self._batch_supported = False
+        self._client._report_queue.put(grpc.GlobalStep(step=1))
+        self._client._report_queue.put(grpc.GlobalStep(step=2))
+        self._client.flush_reports()
+        self.assertIsInstance(self._reports[0], grpc.BatchReport)
+        self.assertEqual([m.step for m in self._reports[1:]], [1, 2])
+
+        self._reports.clear()
+        self._client._report_queue.put(grpc.GlobalStep(step=3))
+        self._client._report_queue.put(grpc.GlobalStep(step=4))
+        self._client.flush_reports()
+        self.assertEqual([m.step for m in self._reports], [3, 4])
+
+    def test_keep_reports_failed_to_flush(self):
+        self._client._report = mock.MagicMock(side_effect=RuntimeError)
+        self._client._report_queue.put(grpc.GlobalStep(step=1))
+        self.assertRaises(RuntimeError, self._client.flush_reports)
+
+        self._client._report = self._record_report
+        self._client._report_queue.put(grpc.GlobalStep(step=2))
+        self._client.flush_reports()
+        self.assertEqual([m.step for m in self._reports[0].messages], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
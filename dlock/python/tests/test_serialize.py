@@ -0,0 +1,48 @@
+# Copyright 2024 The DLRover Authors. All rights reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import math
+import unittest
+from dataclasses import dataclass
+from datetime import datetime
+
+from dlock.python.common.serialize import json_dumps, json_loads
+
+
+@dataclass
+class _Point:
+    x: int = 0
+
+
+class JsonSerializeTest(unittest.TestCase):
+    def test_non_finite_floats(self):
+        data = {"nan": float("nan"), "values": [1.0, float("inf")]}
+        encoded = json_dumps(data)
+        self.assertEqual(encoded, json.dumps(data))
+        decoded = json_loads(encoded)
+        self.assertTrue(math.isnan(decoded["nan"]))
+        self.assertEqual(decoded["values"], [1.0, float("inf")])
+
+    def test_reject_what_json_rejects(self):
+        for value in [datetime.now(), _Point()]:
+            self.assertRaises(TypeError, json_dumps, {"v": value})
+            self.assertRaises(TypeError, json_dumps, {"v": value, "n": None})
+
+    def test_round_trip(self):
+        data = {"null": None, "text": "null", "ints": [1, 2**70]}
+        self.assertEqual(json_loads(json_dumps(data)), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
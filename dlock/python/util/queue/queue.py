@@ -13,6 +13,8 @@
 
 import queue
 import threading
+import time
+from typing import Any, Callable, List
 
 from dlock.python.common.log import default_logger as logger
 
@@ -90,3 +92,71 @@ class RayEventQueue:
                 if not hasattr(RayEventQueue, "_instance"):
                     RayEventQueue._instance = RayEventQueue(*args, **kwargs)
         return RayEventQueue._instance
+
+
+class _BatchItem(object):
+    def __init__(self, value):
+        self.value = value
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class BatchingQueue(object):
+    """BatchingQueue collects the items submitted by concurrent threads
+    and processes them in batch by one background thread. The thread
+    calling `submit` blocks until its item is processed. The items are
+    processed in the order they are added.
+
+    Args:
+        process_fn: the function to process a list of items and return
+            the list of results in the same order.
+        interval: the seconds to wait for more items after the first
+            item of a batch arrives.
+    """
+
+    def __init__(
+        self,
+        process_fn: Callable[[List[Any]], List[Any]],
+        interval=0.005,
+        name="batching-queue",
+    ):
+        self._process_fn = process_fn
+        self._interval = interval
+        self._cond = threading.Condition()
+        self._items: List[_BatchItem] = []
+        threading.Thread(target=self._run, name=name, daemon=True).start()
+
+    def submit(self, value):
+        item = self._add(value)
+        item.done.wait()
+        if item.error:
+            raise item.error
+        return item.result
+
+    def _add(self, value):
+        item = _BatchItem(value)
+        with self._cond:
+            self._items.append(item)
+            self._cond.notify()
+        return item
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._items:
+                    self._cond.wait()
+            if self._interval > 0:
+                time.sleep(self._interval)
+            with self._cond:
+                items, self._items = self._items, []
+            try:
+                results = self._process_fn([item.value for item in items])
+                for item, result in zip(items, results):
+                    item.result = result
+            except Exception as e:
+                logger.warning(f"Fail to process the batch: {e}")
+                for item in items:
+                    item.error = e
+            for item in items:
+                item.done.set()
@@ -86,14 +86,13 @@ For auto-tuning parallelism configuration, you need to specify:
 
 1. ``--auto-tunning``: Whether to auto tune the batch size and learning rate.
 """
+import functools
 import os
 import socket
+import struct
 import sys
-import telnetlib
 import time
-import uuid
-from datetime import datetime
-from typing import Callable, List, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 from torch.distributed.argparse_util import check_env, env
 from torch.distributed.elastic.multiprocessing.api import SubprocessHandler
@@ -121,8 +120,30 @@ from dlock.python.elastic_agent.torch.training import (
 )
 from dlock.trainer.torch.utils import version_less_than_230
 
+# The timeout and backoff in seconds to probe the master.
+_MASTER_PROBE_TIMEOUT = 0.5
+_MASTER_PROBE_BACKOFF_BASE = 0.05
+_MASTER_PROBE_BACKOFF_CAP = 1.0
+
+# The switches of ElasticLaunchConfig which can be enabled by the
+# arguments or the master.
+_MASTER_ENABLED_SWITCHES = (
+    "network_check",
+    "comm_perf_test",
+    "numa_affinity",
+    "auto_tunning",
+    "auto_config",
+    "exclude_straggler",
+    "save_at_breakpoint",
+)
 
-def parse_args(args):
+
+@functools.lru_cache(maxsize=1)
+def _build_args_parser():
+    """Build the parser once and reuse it when main is called again in
+    the same process. The defaults of the `env` actions are read from the
+    environment variables when the parser is built.
+    """
     parser = get_args_parser()
     parser.allow_abbrev = False
     parser.add_argument(
@@ -211,7 +232,11 @@ def parse_args(args):
         action=check_env,
         help="Whether to test the communication performance.",
     )
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args):
+    return _build_args_parser().parse_args(args)
 
 
 class elastic_launch:
@@ -252,14 +277,19 @@ class elastic_launch:
         self._config = config
         self._entrypoint = entrypoint
         self._use_dlock_launch = use_dlock_launch
+        self._launch_agent = (
+            launch_agent if use_dlock_launch else torch_launch_agent
+        )
 
     def __call__(self, *args):
-        if self._use_dlock_launch:
-            return launch_agent(self._config, self._entrypoint, list(args))
-        else:
-            return torch_launch_agent(
-                self._config, self._entrypoint, list(args)
-            )
+        return self._launch_agent(self._config, self._entrypoint, list(args))
+
+
+@functools.lru_cache(maxsize=8)
+def _split_addr(addr) -> Tuple[str, int]:
+    """Split the address like "host:port" into the host and the port."""
+    host, port = addr.rsplit(":", 1)
+    return host, int(port)
 
 
 def _launch_dlock_local_master(master_addr, job_name, node_num):
@@ -269,8 +299,7 @@ def _launch_dlock_local_master(master_addr, job_name, node_num):
         host = "127.0.0.1"
         port = grpc.find_free_port()
     else:
-        host = master_addr.split(":")[0]
-        port = int(master_addr.split(":")[1])
+        host, port = _split_addr(master_addr)
     cmd = os.getenv("PYTHON_EXEC", sys.executable)
     args = (
         "-u",
@@ -298,34 +327,48 @@ def _check_dlock_master_available(addr, timeout=120):
     """Verify that the master grpc servicer is available."""
     if not addr:
         return False
-    host = addr.split(":")[0]
-    port = int(addr.split(":")[1])
+    host, port = _split_addr(addr)
+    try:
+        # Resolve the address once instead of on each probe.
+        family, _, _, _, sockaddr = socket.getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )[0]
+    except socket.gaierror as e:
+        client = MasterClient.singleton_instance(addr)
+        client.report_failures(
+            NodeErrorMessage.SOCKET_GAIERROR,
+            level=TrainingExceptionLevel.NODE_ERROR,
+        )
+        raise e
     start_time = time.time()
+    sleep_time = _MASTER_PROBE_BACKOFF_BASE
     while True:
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.settimeout(_MASTER_PROBE_TIMEOUT)
+        # Reset the probe connection on close to not leave it in TIME_WAIT.
+        sock.setsockopt(
+            socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0)
+        )
         try:
-            telnetlib.Telnet(host=host, port=port, timeout=3)
+            err = sock.connect_ex(sockaddr)
+        finally:
+            sock.close()
+        if err == 0:
             logger.info("dlock master has already started.")
             return True
-        except (socket.timeout, ConnectionRefusedError):
-            time.sleep(1)
-        except socket.gaierror as e:
-            client = MasterClient.singleton_instance(addr)
-            client.report_failures(
-                NodeErrorMessage.SOCKET_GAIERROR,
-                level=TrainingExceptionLevel.NODE_ERROR,
-            )
-            raise e
 
         if time.time() - start_time > timeout:
             return False
+        time.sleep(sleep_time)
+        sleep_time = min(sleep_time * 2, _MASTER_PROBE_BACKOFF_CAP)
 
 
 def _elastic_config_from_args(
     args,
+    master_client: Optional[MasterClient],
 ) -> Tuple[ElasticLaunchConfig, Union[Callable, str], List[str]]:
     config, cmd, cmd_args = config_from_args(args)
 
-    master_config = _elastic_config_from_master(config)
     elastic_config = ElasticLaunchConfig(**config.__dict__)
 
     # PyTorch >= 2.3.0 remove log_dir in the LaunchConfig.
@@ -333,51 +376,15 @@ def _elastic_config_from_args(
         elastic_config.log_dir = config.logs_specs.root_log_dir
 
     elastic_config.precheck = getattr(args, "precheck", False)
-    if master_config.precheck:
-        logger.info("Enable precheck by master")
-        elastic_config.precheck = master_config.precheck
-
-    elastic_config.network_check = getattr(args, "network_check", False)
-    if master_config.network_check:
-        logger.info("Enable network checking by master")
-        elastic_config.network_check = True
-
-    elastic_config.comm_perf_test = getattr(args, "comm_perf_test", False)
-    if master_config.comm_perf_test:
-        logger.info("Enable comm_perf_test by master")
-        elastic_config.comm_perf_test = True
-
-    elastic_config.numa_affinity = getattr(args, "numa_affinity", False)
-    if master_config.numa_affinity:
-        logger.info("Enable numa affinity by master")
-        elastic_config.numa_affinity = True
-
-    elastic_config.auto_tunning = getattr(args, "auto_tunning", False)
-    if master_config.auto_tunning:
-        logger.info("Enable auto_tunning by master")
-        elastic_config.auto_tunning = True
-
-    elastic_config.auto_config = getattr(args, "auto_config", False)
-    if master_config.auto_config:
-        logger.info("Enable auto_config by master")
-        elastic_config.auto_config = True
+    for name in _MASTER_ENABLED_SWITCHES:
+        setattr(elastic_config, name, getattr(args, name, False))
+    _elastic_config_from_master(elastic_config, master_client)
 
     elastic_config.accelerator = getattr(
         args, "accelerator", Accelerators.NVIDIA_GPU
     )
-
-    elastic_config.exclude_straggler = getattr(
-        args, "exclude_straggler", False
-    )
-    if master_config.exclude_straggler:
-        elastic_config.exclude_straggler = True
     elastic_config.set_node_unit(getattr(args, "node_unit", 1))
     elastic_config.training_port = getattr(args, "training_port", 60000)
-    elastic_config.save_at_breakpoint = getattr(
-        args, "save_at_breakpoint", False
-    )
-    if master_config.save_at_breakpoint:
-        elastic_config.save_at_breakpoint = True
     elastic_config.auto_configure_params()
     elastic_config.update_precheck_args()
     elastic_config.rdzv_backend = "dlock-master"
@@ -387,50 +394,31 @@ def _elastic_config_from_args(
     return elastic_config, cmd, cmd_args
 
 
-def _elastic_config_from_master(config) -> ElasticLaunchConfig:
-    elastic_config = ElasticLaunchConfig(**config.__dict__)
-
-    _client = MasterClient.singleton_instance()
-    try:
-        logger.info("try to get elastic run config from master")
-        master_configs = _client.get_elastic_run_config()
-    except Exception as e:
-        logger.error(f"fail to get elastic config from master: {e}")
-        master_configs = {}
-
-    elastic_config.network_check = False
-    if "network_check" in master_configs:
-        elastic_config.network_check = True
-
-    elastic_config.comm_perf_test = False
-    if "comm_perf_test" in master_configs:
-        elastic_config.comm_perf_test = True
-
-    elastic_config.auto_tunning = False
-    if "auto_tunning" in master_configs:
-        elastic_config.auto_tunning = True
-
-    elastic_config.auto_config = False
-    if "auto_config" in master_configs:
-        elastic_config.auto_config = True
-
-    elastic_config.exclude_straggler = False
-    if "exclude_straggler" in master_configs:
-        elastic_config.exclude_straggler = True
-
-    elastic_config.save_at_breakpoint = False
-    if "save_at_breakpoint" in master_configs:
-        elastic_config.save_at_breakpoint = True
-
-    elastic_config.numa_affinity = False
-    if "numa_affinity" in master_configs:
-        elastic_config.numa_affinity = True
+def _elastic_config_from_master(
+    elastic_config: ElasticLaunchConfig,
+    master_client: Optional[MasterClient],
+):
+    """Enable the switches of the config which are set in the master."""
+    master_configs = {}
+    if master_client is None:
+        logger.error("fail to get elastic config without the master client.")
+    else:
+        try:
+            logger.info("try to get elastic run config from master")
+            master_configs = master_client.get_elastic_run_config()
+        except Exception as e:
+            logger.error(f"fail to get elastic config from master: {e}")
 
-    return elastic_config
+    for name in _MASTER_ENABLED_SWITCHES:
+        if name in master_configs:
+            logger.info(f"Enable {name} by master")
+            setattr(elastic_config, name, True)
 
 
-def _check_to_use_dlock_run(master_addr, max_nodes, timeout=120):
-    if _check_dlock_master_available(master_addr, timeout):
+def _check_to_use_dlock_run(
+    master_ready, master_addr, max_nodes, timeout=120
+):
+    if master_ready or _check_dlock_master_available(master_addr, timeout):
         return True
     elif max_nodes == 1:
         logger.info("Use native torchrun to start job on the single node.")
@@ -445,14 +433,20 @@ def _check_to_use_dlock_run(master_addr, max_nodes, timeout=120):
         raise ValueError(f"{master_addr} is not connected. ")
 
 
+def _set_env(name, value):
+    """Set the environment variable only if the value changes because
+    each write calls putenv."""
+    if os.environ.get(name) != value:
+        os.environ[name] = value
+
+
 def run(args):
     logger.info(f"dlock agent started with: {cu.get_dlock_version()}.")
     master_handler = None
     master_addr = os.getenv(NodeEnv.DLOCK_MASTER_ADDR, "")
     node_rank = env_utils.get_node_rank()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-    job_name = os.getenv(NodeEnv.JOB_NAME, f"standalone_{timestamp}")
-    os.environ[NodeEnv.TORCHELASTIC_RUN_ID] = job_name
+    job_name = os.getenv(NodeEnv.JOB_NAME, f"standalone_{time.time_ns()}")
+    _set_env(NodeEnv.TORCHELASTIC_RUN_ID, job_name)
     dlock_master_ready = grpc.addr_connected(master_addr)
     _, max_nodes = parse_min_max_nnodes(args.nnodes)
     if not dlock_master_ready and node_rank == 0:
@@ -463,10 +457,14 @@ def run(args):
             max_nodes,
         )
         logger.info(f"Set the dlock master addr as {master_addr}")
-        os.environ[NodeEnv.DLOCK_MASTER_ADDR] = master_addr
-    use_dlock_launch = _check_to_use_dlock_run(master_addr, max_nodes)
+        _set_env(NodeEnv.DLOCK_MASTER_ADDR, master_addr)
+    use_dlock_launch = _check_to_use_dlock_run(
+        dlock_master_ready, master_addr, max_nodes
+    )
 
     if args.standalone and not use_dlock_launch:
+        import uuid
+
         args.rdzv_backend = "c10d"
         args.rdzv_endpoint = "localhost:29400"
         args.rdzv_id = str(uuid.uuid4())
@@ -479,7 +477,8 @@ def run(args):
             f"**************************************\n"
         )
 
-    config, cmd, cmd_args = _elastic_config_from_args(args)
+    master_client = MasterClient.singleton_instance(master_addr)
+    config, cmd, cmd_args = _elastic_config_from_args(args, master_client)
     config.run_id = job_name
     config.role = "dlock-trainer"
     try:
@@ -11,15 +11,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+
 import torch
 from packaging import version
 
 
+@functools.lru_cache(maxsize=1)
 def version_less_than_230():
     current_version = version.parse(torch.__version__).base_version
     return version.parse(current_version) <= version.parse("2.2.2")
 
 
+@functools.lru_cache(maxsize=1)
 def version_less_than_240():
     current_version = version.parse(torch.__version__).base_version
     return version.parse(current_version) <= version.parse("2.3.1")